@@ -0,0 +1,49 @@
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from interpreter.interpreter import Interpreter
+from bench_numeric import STATEMENTS, REPEAT, WORKLOADS
+
+# Generous enough that no workload trips them, so every check runs.
+LIMITS = {
+    "max_steps": 10 ** 9,
+    "timeout": 3600.0,
+    "max_variables": 10 ** 6,
+    "max_output_bytes": 10 ** 9,
+}
+
+CONFIGS = {
+    "unlimited": {"max_int_bits": None},
+    "default": {},
+    "all limits": LIMITS,
+}
+
+def bench(ast, limits):
+    best = None
+    for _ in range(REPEAT):
+        interpreter = Interpreter(ast, **limits)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = interpreter.interpret()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    assert result == "Interpretation successful.", result
+    return best
+
+if __name__ == "__main__":
+    for workload, make_source in WORKLOADS.items():
+        tokens, errors = Lexer(make_source(STATEMENTS)).tokenize()
+        ast, errors = Parser(tokens).parse()
+        print(f"{workload}:")
+        baseline = None
+        for name, limits in CONFIGS.items():
+            elapsed = bench(ast, limits)
+            baseline = baseline or elapsed
+            print(f"{name:>11}: {elapsed * 1000:8.1f} ms  {(elapsed / baseline - 1) * 100:+6.1f}% vs unlimited")
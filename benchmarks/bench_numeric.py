@@ -0,0 +1,62 @@
+import contextlib
+import io
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from lexer.lexer import Lexer
+from parser.parser import Parser, NUMERIC_TYPES
+from interpreter.interpreter import Interpreter
+
+STATEMENTS = 20000
+REPEAT = 5
+
+def arithmetic_source(statements):
+    lines = ["let x = 1;", "let y = 3;"]
+    for i in range(statements):
+        lines.append(f"x = (x * 3 + y * {i % 7 + 1}) - x * 2;")
+    lines.append("print(x);")
+    return "\n".join(lines)
+
+def print_source(statements):
+    lines = ["let x = 1;"]
+    for i in range(statements):
+        lines.append(f"x = x + {i % 7 + 1};")
+        lines.append("print(x);")
+    return "\n".join(lines)
+
+WORKLOADS = {
+    "arithmetic": arithmetic_source,
+    "print": print_source,
+}
+
+def bench(workload, numeric):
+    tokens, errors = Lexer(WORKLOADS[workload](STATEMENTS)).tokenize()
+    ast, errors = Parser(tokens, numeric).parse()
+    if errors:
+        raise SystemExit(f"{numeric}: {errors[0]}")
+    best = None
+    for _ in range(REPEAT):
+        interpreter = Interpreter(ast)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = interpreter.interpret()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, interpreter.steps, result, ast.numeric
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        elapsed, steps, result, resolved = bench(sys.argv[1], sys.argv[2])
+        label = f"{sys.argv[2]} ({resolved})"
+        print(f"{label:>19}: {elapsed * 1000:8.1f} ms  {steps / elapsed / 1e3:7.1f} k statements/s  {result}")
+    else:
+        # Each mode runs in a fresh process so the interpreter's adaptive
+        # specialization for one number type does not penalize the next.
+        for workload in WORKLOADS:
+            print(f"{workload}:")
+            for numeric in ["auto", *NUMERIC_TYPES]:
+                subprocess.run([sys.executable, __file__, workload, numeric], check=True)
@@ -1,15 +1,21 @@
 import tkinter as tk
 from tkinter import scrolledtext, messagebox, filedialog
 import tkinter.ttk as ttk
+import itertools
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from lexer.lexer import Lexer
+from lexer.source_map import LineIndex
 from parser.parser import Parser
 from interpreter.interpreter import Interpreter
 
+TREE_PAGE_SIZE = 500
+INTERPRET_TIMEOUT = 5.0
+INTERPRET_MAX_OUTPUT_BYTES = 1_000_000
+
 class CompilerGUI:
     def __init__(self, root):
         self.root = root
@@ -22,6 +28,7 @@ class CompilerGUI:
         self.code_editor = scrolledtext.ScrolledText(root, height=10, wrap=tk.WORD)
         self.code_editor.pack(fill=tk.X, padx=10, pady=5)
         self.code_editor.insert(tk.END, "let x = 10;\nlet y = x + 5;\nprint(y);")
+        self.code_editor.bind("<<Modified>>", self.on_code_modified)
 
         self.top_controls = tk.Frame(root)
         self.top_controls.pack(fill=tk.X, padx=10, pady=5)
@@ -35,6 +42,12 @@ class CompilerGUI:
         self.examples_combo.pack(side=tk.LEFT, padx=5)
         self.examples_combo.bind("<<ComboboxSelected>>", self.on_example_selected)
         self.load_examples()
+        self.numeric_label = tk.Label(self.top_controls, text="Numbers:")
+        self.numeric_label.pack(side=tk.LEFT, padx=10)
+        self.numeric_combo = ttk.Combobox(self.top_controls, state="readonly", width=10,
+                                          values=["float", "auto", "int", "fraction", "decimal"])
+        self.numeric_combo.pack(side=tk.LEFT, padx=5)
+        self.numeric_combo.current(0)
 
         # Buttons
         self.button_frame = tk.Frame(root)
@@ -73,12 +86,20 @@ class CompilerGUI:
 
         self.tree_text = scrolledtext.ScrolledText(self.tree_tab, height=18, wrap=tk.WORD)
         self.tree_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.tree_text.bind("<Double-Button-1>", self.on_diagnostic_selected)
+        self.tree_lines = None
+        self.tree_more_button = tk.Button(self.tree_tab, text="Show More", command=self.show_more_tree, state=tk.DISABLED)
+        self.tree_more_button.pack(anchor=tk.E, padx=5, pady=5)
 
         self.semantic_text = scrolledtext.ScrolledText(self.semantic_tab, height=10, wrap=tk.WORD)
         self.semantic_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.semantic_text.bind("<Double-Button-1>", self.on_diagnostic_selected)
 
         self.console_text = scrolledtext.ScrolledText(self.console_tab, height=10, wrap=tk.WORD)
         self.console_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.console_text.bind("<Double-Button-1>", self.on_diagnostic_selected)
+        # Output widget -> (span per text row, LineIndex) for jumping to errors.
+        self.diagnostics = {}
 
         self.env_frame = tk.Frame(self.console_tab)
         self.env_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -92,7 +113,46 @@ class CompilerGUI:
         self.env_tree.pack(fill=tk.X)
 
     def get_code(self):
-        return self.code_editor.get("1.0", tk.END).strip()
+        # Only trailing whitespace is dropped so offsets and lines match the editor.
+        return self.code_editor.get("1.0", tk.END).rstrip()
+
+    def on_code_modified(self, event=None):
+        if not self.code_editor.edit_modified():
+            return
+        # Results computed from the old source no longer match the editor.
+        self.tree_lines = None
+        self.tree_more_button.config(state=tk.DISABLED)
+        self.diagnostics.clear()
+        self.code_editor.edit_modified(False)
+
+    def jump_to_span(self, line_index, span):
+        (start_line, start_col), (end_line, end_col) = line_index.span_positions(span)
+        start = f"{start_line}.{start_col - 1}"
+        end = f"{end_line}.{end_col - 1}"
+        self.code_editor.tag_remove(tk.SEL, "1.0", tk.END)
+        self.code_editor.tag_add(tk.SEL, start, end)
+        self.code_editor.mark_set(tk.INSERT, start)
+        self.code_editor.see(start)
+        self.code_editor.focus_set()
+
+    def show_diagnostics(self, widget, header, messages, spans, line_index):
+        widget.delete("1.0", tk.END)
+        widget.insert(tk.END, header + "\n".join(messages))
+        rows = [None] * header.count("\n") + list(spans)
+        self.diagnostics[widget] = (rows, line_index)
+        for span in spans:
+            if span is not None:
+                self.jump_to_span(line_index, span)
+                break
+
+    def on_diagnostic_selected(self, event):
+        if event.widget not in self.diagnostics:
+            return
+        rows, line_index = self.diagnostics[event.widget]
+        row = int(event.widget.index(f"@{event.x},{event.y}").split(".")[0]) - 1
+        if 0 <= row < len(rows) and rows[row] is not None:
+            self.jump_to_span(line_index, rows[row])
+        return "break"
 
     def open_file(self):
         path = filedialog.askopenfilename(filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
@@ -163,40 +223,52 @@ class CompilerGUI:
 
     def syntax_analysis(self):
         code = self.get_code()
+        self.diagnostics.pop(self.tree_text, None)
         lexer = Lexer(code)
         tokens, lex_errors = lexer.tokenize()
+        self.tree_lines = None
+        self.tree_more_button.config(state=tk.DISABLED)
         if lex_errors:
             self.tree_text.delete("1.0", tk.END)
             self.tree_text.insert(tk.END, "Lexical errors found. Fix them first.\n" + "\n".join(lex_errors))
             return
-        parser = Parser(tokens)
+        parser = Parser(tokens, self.numeric_combo.get())
         ast, parse_errors = parser.parse()
         self.tree_text.delete("1.0", tk.END)
         if parse_errors:
-            self.tree_text.insert(tk.END, "Parse errors:\n" + "\n".join(parse_errors))
+            self.show_diagnostics(self.tree_text, "Parse errors:\n", parse_errors,
+                                  [span for message, span in parser.diagnostics], LineIndex(code))
         else:
-            import io
-            import sys
-            old_stdout = sys.stdout
-            sys.stdout = buffer = io.StringIO()
-            parser.print_tree(ast)
-            sys.stdout = old_stdout
-            self.tree_text.insert(tk.END, buffer.getvalue())
+            self.tree_lines = parser.iter_tree_lines(ast)
+            self.show_more_tree()
         self.notebook.select(self.tree_tab)
 
+    def show_more_tree(self):
+        if self.tree_lines is None:
+            return
+        lines = list(itertools.islice(self.tree_lines, TREE_PAGE_SIZE))
+        if lines:
+            self.tree_text.insert(tk.END, "\n".join(lines) + "\n")
+        if len(lines) < TREE_PAGE_SIZE:
+            self.tree_lines = None
+            self.tree_more_button.config(state=tk.DISABLED)
+        else:
+            self.tree_more_button.config(state=tk.NORMAL)
+
     def semantic_analysis(self):
         code = self.get_code()
+        self.diagnostics.pop(self.semantic_text, None)
         lexer = Lexer(code)
         tokens, lex_errors = lexer.tokenize()
         if lex_errors:
             self.semantic_text.delete("1.0", tk.END)
             self.semantic_text.insert(tk.END, "Lexical errors found. Fix them first.\n" + "\n".join(lex_errors))
             return
-        parser = Parser(tokens)
+        parser = Parser(tokens, self.numeric_combo.get())
         ast, parse_errors = parser.parse()
         if parse_errors:
-            self.semantic_text.delete("1.0", tk.END)
-            self.semantic_text.insert(tk.END, "Parse errors found. Fix them first.\n" + "\n".join(parse_errors))
+            self.show_diagnostics(self.semantic_text, "Parse errors found. Fix them first.\n", parse_errors,
+                                  [span for message, span in parser.diagnostics], LineIndex(code))
             return
         try:
             from semantic.semantic_analyzer import SemanticAnalyzer
@@ -205,27 +277,29 @@ class CompilerGUI:
             self.semantic_text.delete("1.0", tk.END)
             self.semantic_text.insert(tk.END, f"Semantic analyzer unavailable: {e}")
             return
-        errors = analyzer.analyze(ast)
-        self.semantic_text.delete("1.0", tk.END)
+        errors = analyzer.analyze(ast, code)
         if errors:
-            self.semantic_text.insert(tk.END, "\n".join(errors))
+            self.show_diagnostics(self.semantic_text, "", errors,
+                                  [span for message, span in analyzer.diagnostics], analyzer.line_index)
         else:
+            self.semantic_text.delete("1.0", tk.END)
             self.semantic_text.insert(tk.END, "No semantic errors found.")
         self.notebook.select(self.semantic_tab)
 
     def interpret(self):
         code = self.get_code()
+        self.diagnostics.pop(self.console_text, None)
         lexer = Lexer(code)
         tokens, lex_errors = lexer.tokenize()
         if lex_errors:
             self.interpret_text.delete("1.0", tk.END)
             self.interpret_text.insert(tk.END, "Lexical errors found. Fix them first.\n" + "\n".join(lex_errors))
             return
-        parser = Parser(tokens)
+        parser = Parser(tokens, self.numeric_combo.get())
         ast, parse_errors = parser.parse()
         if parse_errors:
-            self.console_text.delete("1.0", tk.END)
-            self.console_text.insert(tk.END, "Parse errors found. Fix them first.\n" + "\n".join(parse_errors))
+            self.show_diagnostics(self.console_text, "Parse errors found. Fix them first.\n", parse_errors,
+                                  [span for message, span in parser.diagnostics], LineIndex(code))
             return
         try:
             from semantic.semantic_analyzer import SemanticAnalyzer
@@ -234,12 +308,12 @@ class CompilerGUI:
             self.interpret_text.delete("1.0", tk.END)
             self.interpret_text.insert(tk.END, f"Semantic analyzer unavailable: {e}")
             return
-        sem_errors = analyzer.analyze(ast)
+        sem_errors = analyzer.analyze(ast, code)
         if sem_errors:
-            self.console_text.delete("1.0", tk.END)
-            self.console_text.insert(tk.END, "Semantic errors found. Fix them first.\n" + "\n".join(sem_errors))
+            self.show_diagnostics(self.console_text, "Semantic errors found. Fix them first.\n", sem_errors,
+                                  [span for message, span in analyzer.diagnostics], analyzer.line_index)
             return
-        interpreter = Interpreter(ast)
+        interpreter = Interpreter(ast, timeout=INTERPRET_TIMEOUT, max_output_bytes=INTERPRET_MAX_OUTPUT_BYTES)
         import io
         import sys
         old_stdout = sys.stdout
@@ -262,7 +336,10 @@ class CompilerGUI:
     def clear_all_outputs(self):
         self.tokens_text.delete("1.0", tk.END)
         self.tree_text.delete("1.0", tk.END)
+        self.tree_lines = None
+        self.tree_more_button.config(state=tk.DISABLED)
         self.semantic_text.delete("1.0", tk.END)
+        self.diagnostics.clear()
         self.console_text.delete("1.0", tk.END)
         for i in self.env_tree.get_children():
             self.env_tree.delete(i)
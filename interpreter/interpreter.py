@@ -1,33 +1,167 @@
+import contextlib
+import decimal
+import math
+import sys
+import time
+
 from parser.parser import *
 
+# Steps are statements. Expressions are not counted: a statement's work is
+# bounded by its size, because values are checked at statement boundaries
+# and a result has at most max_int_bits per literal or variable it reads.
+# How many statements run between wall-clock checks.
+CHECK_INTERVAL = 1024
+DEFAULT_MAX_INT_BITS = 1 << 20
+# Decimal mode is exact: any result that would need rounding at this
+# precision is an error rather than a silently rounded value.
+DECIMAL_PRECISION = 1000
+DECIMAL_CONTEXT = decimal.Context(
+    prec=DECIMAL_PRECISION,
+    traps=[decimal.Inexact, decimal.Rounded, decimal.Overflow, decimal.InvalidOperation, decimal.DivisionByZero],
+)
+
+class ResourceLimitError(Exception):
+    def __init__(self, limit, maximum):
+        super().__init__(f"{limit} limit of {maximum} exceeded.")
+        self.limit = limit
+        self.maximum = maximum
+
+def int_divide(left, right):
+    quotient, remainder = divmod(left, right)
+    if remainder:
+        raise Exception(f"Inexact division {left} / {right} in int mode.")
+    return quotient
+
+def decimal_divide(left, right):
+    # Runs under the interpreter's local copy of DECIMAL_CONTEXT.
+    try:
+        return left / right
+    except decimal.Overflow:
+        raise
+    except (decimal.Inexact, decimal.Rounded):
+        raise Exception(f"Inexact division {left} / {right} in decimal mode.")
+
+def true_divide(left, right):
+    return left / right
+
+DIVIDE = {
+    "float": true_divide,
+    "int": int_divide,
+    "fraction": true_divide,
+    "decimal": decimal_divide,
+}
+
+def check_int(value, max_bits):
+    if max_bits is not None and value.bit_length() > max_bits:
+        raise ResourceLimitError("integer bits", max_bits)
+
+def check_fraction(value, max_bits):
+    check_int(value.numerator, max_bits)
+    check_int(value.denominator, max_bits)
+
+def check_float(value, max_bits):
+    if not math.isfinite(value):
+        raise ResourceLimitError("float range", sys.float_info.max)
+
+# Decimal needs no check: DECIMAL_CONTEXT traps overflow and rounding.
+CHECK_VALUE = {
+    "float": check_float,
+    "int": check_int,
+    "fraction": check_fraction,
+    "decimal": None,
+}
+
 class Interpreter:
-    def __init__(self, ast):
+    def __init__(self, ast, max_steps=None, timeout=None, max_variables=None, max_output_bytes=None,
+                 max_int_bits=DEFAULT_MAX_INT_BITS):
         self.ast = ast
         self.environment = {}
+        numeric = getattr(ast, "numeric", "float")
+        self.numeric = numeric
+        self.divide = DIVIDE[numeric]
+        self.check_value = CHECK_VALUE[numeric]
+        self.max_int_bits = max_int_bits
+        self.max_steps = max_steps
+        self.timeout = timeout
+        self.max_variables = max_variables
+        self.max_output_bytes = max_output_bytes
+        self.steps = 0
+        self.output_bytes = 0
+        self.deadline = None
+        self.next_check = float("inf")
+        self.error = None
 
     def interpret(self):
+        self.steps = 0
+        self.output_bytes = 0
+        self.error = None
+        self.deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        self.schedule_check()
+        if self.deadline is not None:
+            self.next_check = 1
+        context = decimal.localcontext(DECIMAL_CONTEXT) if self.numeric == "decimal" else contextlib.nullcontext()
         try:
-            self.visit_program(self.ast)
+            with context:
+                self.visit_program(self.ast)
             return "Interpretation successful."
+        except ResourceLimitError as e:
+            self.error = e
+            return f"Resource limit exceeded: {str(e)}"
+        except decimal.Overflow:
+            # Overflow subclasses Inexact and Rounded, so it must be caught first.
+            self.error = ResourceLimitError("decimal range", DECIMAL_CONTEXT.Emax)
+            return f"Resource limit exceeded: {str(self.error)}"
+        except (decimal.Inexact, decimal.Rounded):
+            self.error = ResourceLimitError("decimal digits", DECIMAL_PRECISION)
+            return f"Resource limit exceeded: {str(self.error)}"
         except Exception as e:
+            self.error = e
             return f"Runtime error: {str(e)}"
 
+    def schedule_check(self):
+        if self.max_steps is None and self.deadline is None:
+            self.next_check = float("inf")
+        elif self.deadline is None:
+            self.next_check = self.max_steps + 1
+        elif self.max_steps is None:
+            self.next_check = self.steps + CHECK_INTERVAL
+        else:
+            self.next_check = min(self.steps + CHECK_INTERVAL, self.max_steps + 1)
+
+    def check_limits(self):
+        if self.max_steps is not None and self.steps > self.max_steps:
+            raise ResourceLimitError("steps", self.max_steps)
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise ResourceLimitError("timeout", self.timeout)
+        self.schedule_check()
+
     def visit_program(self, node):
         for stmt in node.statements:
             self.visit_statement(stmt)
 
     def visit_statement(self, node):
+        self.steps += 1
+        if self.steps >= self.next_check:
+            self.check_limits()
+        value = self.visit_expression(node.expr)
+        if self.check_value is not None:
+            self.check_value(value, self.max_int_bits)
         if isinstance(node, VarDecl):
-            value = self.visit_expression(node.expr)
+            if (self.max_variables is not None and node.name not in self.environment
+                    and len(self.environment) >= self.max_variables):
+                raise ResourceLimitError("variables", self.max_variables)
             self.environment[node.name] = value
         elif isinstance(node, Assign):
-            value = self.visit_expression(node.expr)
             if node.name not in self.environment:
                 raise Exception(f"Variable '{node.name}' not declared.")
             self.environment[node.name] = value
         elif isinstance(node, PrintStmt):
-            value = self.visit_expression(node.expr)
-            print(value)
+            text = str(value)
+            if self.max_output_bytes is not None:
+                self.output_bytes += len(text.encode("utf-8")) + 1
+                if self.output_bytes > self.max_output_bytes:
+                    raise ResourceLimitError("output bytes", self.max_output_bytes)
+            print(text)
 
     def visit_expression(self, node):
         if isinstance(node, BinaryOp):
@@ -42,7 +176,7 @@ class Interpreter:
             elif node.op.type == DIV:
                 if right == 0:
                     raise Exception("Division by zero.")
-                return left / right
+                return self.divide(left, right)
         elif isinstance(node, UnaryOp):
             expr = self.visit_expression(node.expr)
             if node.op.type == MINUS:
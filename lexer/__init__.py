@@ -1 +1,2 @@
 from .lexer import Lexer
+from .source_map import LineIndex
@@ -15,7 +15,7 @@ class Lexer:
         while not self.is_at_end():
             self.start = self.current
             self.scan_token()
-        self.tokens.append(Token(EOF, "", self.line, self.column))
+        self.tokens.append(Token(EOF, "", self.line, self.column, self.current))
         return self.tokens, self.errors
 
     def is_at_end(self):
@@ -47,7 +47,7 @@ class Lexer:
 
     def add_token(self, type):
         text = self.source[self.start:self.current]
-        self.tokens.append(Token(type, text, self.line, self.column - len(text)))
+        self.tokens.append(Token(type, text, self.line, self.column - len(text), self.start))
 
     def scan_token(self):
         c = self.advance()
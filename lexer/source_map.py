@@ -0,0 +1,27 @@
+from bisect import bisect_right
+
+class LineIndex:
+    def __init__(self, source):
+        self.line_starts = [0]
+        index = source.find("\n")
+        while index != -1:
+            self.line_starts.append(index + 1)
+            index = source.find("\n", index + 1)
+
+    def line_count(self):
+        return len(self.line_starts)
+
+    def line_start(self, line):
+        return self.line_starts[line - 1]
+
+    def position(self, offset):
+        line = bisect_right(self.line_starts, offset)
+        return line, offset - self.line_starts[line - 1] + 1
+
+    def span_positions(self, span):
+        start, end = span
+        return self.position(start), self.position(end)
+
+    def describe(self, span):
+        line, column = self.position(span[0])
+        return f"line {line}, col {column}"
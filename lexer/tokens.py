@@ -41,11 +41,12 @@ KEYWORDS = {
 }
 
 class Token:
-    def __init__(self, type, lexeme, line, column):
+    def __init__(self, type, lexeme, line, column, offset=None):
         self.type = type
         self.lexeme = lexeme
         self.line = line
         self.column = column
+        self.offset = offset
 
     def __repr__(self):
         return f"Token({self.type}, '{self.lexeme}', {self.line}, {self.column})"
@@ -1,11 +1,40 @@
+import itertools
+import math
+from decimal import Decimal
+from fractions import Fraction
+
 from lexer.tokens import *
 
+NUMERIC_TYPES = {
+    "float": float,
+    "int": int,
+    "fraction": Fraction,
+    "decimal": Decimal,
+}
+# Largest integer auto mode will evaluate while proving divisions exact.
+AUTO_MAX_BITS = 1 << 16
+
+def resolve_numeric(tokens, numeric):
+    if numeric != "auto":
+        return numeric
+    for token in tokens:
+        if token.type == NUMBER and "." in token.lexeme:
+            return "float"
+    return "int"
+
+class ParseError(Exception):
+    def __init__(self, message, token):
+        super().__init__(message)
+        self.token = token
+
 class ASTNode:
-    pass
+    # (start, end) character offsets into the source, end exclusive.
+    span = None
 
 class Program(ASTNode):
-    def __init__(self, statements):
+    def __init__(self, statements, numeric="float"):
         self.statements = statements
+        self.numeric = numeric
 
 class VarDecl(ASTNode):
     def __init__(self, name, expr):
@@ -40,11 +69,57 @@ class Identifier(ASTNode):
     def __init__(self, name):
         self.name = name
 
+def fold_constant(node, environment):
+    # Programs have no input, so integer expressions can be evaluated while
+    # compiling. Raises ValueError when a result is not a bounded exact int.
+    if isinstance(node, Number):
+        return node.value
+    elif isinstance(node, Identifier):
+        if node.name not in environment:
+            raise ValueError(f"Variable '{node.name}' not declared.")
+        return environment[node.name]
+    elif isinstance(node, UnaryOp):
+        return -fold_constant(node.expr, environment)
+    elif isinstance(node, BinaryOp):
+        left = fold_constant(node.left, environment)
+        right = fold_constant(node.right, environment)
+        if node.op.type == PLUS:
+            value = left + right
+        elif node.op.type == MINUS:
+            value = left - right
+        elif node.op.type == MUL:
+            value = left * right
+        elif right == 0 or left % right:
+            raise ValueError("Inexact division.")
+        else:
+            value = left // right
+        if value.bit_length() > AUTO_MAX_BITS:
+            raise ValueError("Integer too large to fold.")
+        return value
+    raise ValueError("Invalid expression.")
+
+def divisions_are_exact(program):
+    environment = {}
+    try:
+        for stmt in program.statements:
+            value = fold_constant(stmt.expr, environment)
+            if isinstance(stmt, (VarDecl, Assign)):
+                environment[stmt.name] = value
+    except (ValueError, RecursionError):
+        return False
+    return True
+
 class Parser:
-    def __init__(self, tokens):
+    def __init__(self, tokens, numeric="float"):
         self.tokens = tokens
         self.current = 0
         self.errors = []
+        self.diagnostics = []
+        self.auto = numeric == "auto"
+        self.numeric = resolve_numeric(tokens, numeric)
+        if self.numeric not in NUMERIC_TYPES:
+            raise ValueError(f"Unknown numeric mode '{numeric}'.")
+        self.number_type = NUMERIC_TYPES[self.numeric]
 
     def parse(self):
         statements = []
@@ -54,9 +129,34 @@ class Parser:
                 if stmt:
                     statements.append(stmt)
             except Exception as e:
-                self.errors.append(str(e))
+                self.error(str(e), getattr(e, "token", self.peek()))
                 self.synchronize()
-        return Program(statements), self.errors
+        program = Program(statements, self.numeric)
+        if (self.auto and self.numeric == "int" and any(token.type == DIV for token in self.tokens)
+                and not divisions_are_exact(program)):
+            self.use_float(program)
+        if self.peek().offset is not None:
+            program.span = (0, self.peek().offset)
+        return program, self.errors
+
+    def use_float(self, program):
+        self.numeric = program.numeric = "float"
+        self.number_type = float
+        for item, depth, index, is_last in self.walk_tree(program):
+            if isinstance(item, Number):
+                try:
+                    item.value = float(item.value)
+                except OverflowError:
+                    message = f"Number '{item.value}' is out of range in float mode."
+                    self.diagnostics.append((message, item.span))
+                    self.errors.append(message)
+
+    def error(self, message, token):
+        span = None
+        if token.offset is not None:
+            span = (token.offset, token.offset + len(token.lexeme))
+        self.diagnostics.append((message, span))
+        self.errors.append(f"{message.rstrip('.')} at line {token.line}, col {token.column}.")
 
     def is_at_end(self):
         return self.peek().type == EOF
@@ -87,7 +187,7 @@ class Parser:
     def consume(self, type, message):
         if self.check(type):
             return self.advance()
-        raise Exception(message)
+        raise ParseError(message, self.peek())
 
     def synchronize(self):
         self.advance()
@@ -98,13 +198,20 @@ class Parser:
                 return
             self.advance()
 
+    def finish(self, node, start):
+        end = self.previous()
+        if start.offset is not None and end.offset is not None:
+            node.span = (start.offset, end.offset + len(end.lexeme))
+        return node
+
     def statement(self):
+        start = self.peek()
         if self.match(LET):
-            return self.var_decl()
+            return self.finish(self.var_decl(), start)
         elif self.match(PRINT):
-            return self.print_stmt()
+            return self.finish(self.print_stmt(), start)
         elif self.check(ID):
-            return self.assign()
+            return self.finish(self.assign(), start)
         return None
 
     def end_stmt(self, context):
@@ -114,7 +221,7 @@ class Parser:
             return
         if self.peek().type in [LET, PRINT, ID]:
             return
-        raise Exception(f"Expect ';' after {context}.")
+        raise ParseError(f"Expect ';' after {context}.", self.peek())
 
     def var_decl(self):
         name = self.consume(ID, "Expect variable name.").lexeme
@@ -138,71 +245,113 @@ class Parser:
         return PrintStmt(expr)
 
     def expression(self):
+        start = self.peek()
         expr = self.term()
         while self.match(PLUS, MINUS):
             op = self.previous()
             right = self.term()
-            expr = BinaryOp(expr, op, right)
+            expr = self.finish(BinaryOp(expr, op, right), start)
         return expr
 
     def term(self):
+        start = self.peek()
         expr = self.factor()
         while self.match(MUL, DIV):
             op = self.previous()
             right = self.factor()
-            expr = BinaryOp(expr, op, right)
+            expr = self.finish(BinaryOp(expr, op, right), start)
         return expr
 
     def factor(self):
         if self.match(MINUS):
             op = self.previous()
             expr = self.factor()
-            return UnaryOp(op, expr)
+            return self.finish(UnaryOp(op, expr), op)
         elif self.match(LPAREN):
             expr = self.expression()
             self.consume(RPAREN, "Expect ')' after expression.")
             return expr
         elif self.match(NUMBER):
-            return Number(float(self.previous().lexeme))
+            lexeme = self.previous().lexeme
+            try:
+                value = self.number_type(lexeme)
+            except ValueError:
+                raise ParseError(f"Number '{lexeme}' is not valid in {self.numeric} mode.", self.previous())
+            if isinstance(value, float) and not math.isfinite(value):
+                raise ParseError(f"Number '{lexeme}' is out of range in {self.numeric} mode.", self.previous())
+            return self.finish(Number(value), self.previous())
         elif self.match(ID):
-            return Identifier(self.previous().lexeme)
-        raise Exception("Expect expression.")
+            return self.finish(Identifier(self.previous().lexeme), self.previous())
+        raise ParseError("Expect expression.", self.peek())
 
-    def print_tree(self, node, indent=0):
-        prefix = "  " * indent
+    def tree_label(self, item):
+        if isinstance(item, str):
+            return item
+        elif isinstance(item, Number):
+            return f"Number '{item.value}'"
+        elif isinstance(item, Identifier):
+            return f"ID '{item.name}'"
+        return type(item).__name__
+
+    def tree_children(self, node):
         if isinstance(node, Program):
-            print(f"{prefix}Program")
-            for stmt in node.statements:
-                self.print_tree(stmt, indent + 1)
+            return node.statements
         elif isinstance(node, VarDecl):
-            print(f"{prefix}VarDecl")
-            print(f"{prefix}  ID '{node.name}'")
-            print(f"{prefix}  ASSIGN '='")
-            self.print_tree(node.expr, indent + 2)
-            print(f"{prefix}  SEMI ';'")
+            return ["LET 'let'", f"ID '{node.name}'", "ASSIGN '='", node.expr, "SEMI ';'"]
         elif isinstance(node, Assign):
-            print(f"{prefix}Assign")
-            print(f"{prefix}  ID '{node.name}'")
-            print(f"{prefix}  ASSIGN '='")
-            self.print_tree(node.expr, indent + 2)
-            print(f"{prefix}  SEMI ';'")
+            return [f"ID '{node.name}'", "ASSIGN '='", node.expr, "SEMI ';'"]
         elif isinstance(node, PrintStmt):
-            print(f"{prefix}PrintStmt")
-            print(f"{prefix}  PRINT 'print'")
-            print(f"{prefix}  LPAREN '('")
-            self.print_tree(node.expr, indent + 2)
-            print(f"{prefix}  RPAREN ')'")
-            print(f"{prefix}  SEMI ';'")
+            return ["PRINT 'print'", "LPAREN '('", node.expr, "RPAREN ')'", "SEMI ';'"]
         elif isinstance(node, BinaryOp):
-            print(f"{prefix}BinaryOp")
-            self.print_tree(node.left, indent + 1)
-            print(f"{prefix}  {node.op.type.name} '{node.op.lexeme}'")
-            self.print_tree(node.right, indent + 1)
+            return [node.left, f"{node.op.type.name} '{node.op.lexeme}'", node.right]
         elif isinstance(node, UnaryOp):
-            print(f"{prefix}UnaryOp")
-            print(f"{prefix}  {node.op.type.name} '{node.op.lexeme}'")
-            self.print_tree(node.expr, indent + 1)
-        elif isinstance(node, Number):
-            print(f"{prefix}Number '{node.value}'")
-        elif isinstance(node, Identifier):
-            print(f"{prefix}ID '{node.name}'")
+            return [f"{node.op.type.name} '{node.op.lexeme}'", node.expr]
+        return []
+
+    def walk_tree(self, node):
+        # Yields (item, depth, index, is_last) in pre-order. Children are expanded
+        # only when reached, so taking the first N items costs O(N), not O(tree).
+        yield node, 0, 0, True
+        stack = [(self.tree_children(node), 0)]
+        while stack:
+            children, index = stack[-1]
+            if index >= len(children):
+                stack.pop()
+                continue
+            stack[-1] = (children, index + 1)
+            child = children[index]
+            yield child, len(stack), index, index == len(children) - 1
+            if isinstance(child, ASTNode):
+                stack.append((self.tree_children(child), 0))
+
+    def iter_tree(self, node):
+        path = []
+        for item, depth, index, is_last in self.walk_tree(node):
+            if depth:
+                del path[depth - 1:]
+                path.append(index)
+            yield item, depth, tuple(path), is_last
+
+    def iter_tree_lines(self, node, start=0):
+        # Skipped items only update the stack of last-sibling flags; guide
+        # strings are built for emitted lines only.
+        lasts = []
+        for position, (item, depth, index, is_last) in enumerate(self.walk_tree(node)):
+            if depth:
+                del lasts[depth - 1:]
+                lasts.append(is_last)
+            if position < start:
+                continue
+            label = self.tree_label(item)
+            if depth == 0:
+                yield label
+                continue
+            guides = "".join("    " if last else "│   " for last in lasts[:-1])
+            yield guides + ("└── " if is_last else "├── ") + label
+
+    def render_tree(self, node, start=0, limit=None):
+        return itertools.islice(self.iter_tree_lines(node, start), limit)
+
+    def print_tree(self, node, start=0, limit=None):
+        for line in self.render_tree(node, start, limit):
+            print(line)
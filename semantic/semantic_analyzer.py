@@ -1,16 +1,28 @@
+from lexer.source_map import LineIndex
 from parser.parser import Program, VarDecl, Assign, PrintStmt, BinaryOp, UnaryOp, Number, Identifier
 
 class SemanticAnalyzer:
     def __init__(self):
         self.errors = []
+        self.diagnostics = []
         self.symbols = {}
+        self.line_index = None
 
-    def analyze(self, ast):
+    def analyze(self, ast, source=None):
         self.errors = []
+        self.diagnostics = []
         self.symbols = {}
+        self.line_index = None if source is None else LineIndex(source)
         self.visit_program(ast)
         return self.errors
 
+    def error(self, message, node):
+        span = getattr(node, "span", None)
+        self.diagnostics.append((message + ".", span))
+        if self.line_index is not None and span is not None:
+            message = f"{message} at {self.line_index.describe(span)}"
+        self.errors.append(message + ".")
+
     def visit_program(self, node):
         for stmt in node.statements:
             self.visit_statement(stmt)
@@ -18,12 +30,12 @@ class SemanticAnalyzer:
     def visit_statement(self, node):
         if isinstance(node, VarDecl):
             if node.name in self.symbols:
-                self.errors.append(f"Variable '{node.name}' already declared.")
+                self.error(f"Variable '{node.name}' already declared", node)
             self.symbols.setdefault(node.name, "number")
             self.visit_expression(node.expr)
         elif isinstance(node, Assign):
             if node.name not in self.symbols:
-                self.errors.append(f"Variable '{node.name}' not declared.")
+                self.error(f"Variable '{node.name}' not declared", node)
             self.visit_expression(node.expr)
         elif isinstance(node, PrintStmt):
             self.visit_expression(node.expr)
@@ -38,6 +50,6 @@ class SemanticAnalyzer:
             return
         elif isinstance(node, Identifier):
             if node.name not in self.symbols:
-                self.errors.append(f"Variable '{node.name}' not declared.")
+                self.error(f"Variable '{node.name}' not declared", node)
         else:
-            self.errors.append("Invalid expression.")
+            self.error("Invalid expression", node)
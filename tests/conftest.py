@@ -0,0 +1,26 @@
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from interpreter.interpreter import Interpreter
+
+@pytest.fixture
+def run():
+    def run(source, numeric="float", **limits):
+        tokens, lex_errors = Lexer(source).tokenize()
+        assert not lex_errors
+        ast, parse_errors = Parser(tokens, numeric).parse()
+        assert not parse_errors
+        interpreter = Interpreter(ast, **limits)
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            result = interpreter.interpret()
+        return interpreter, result, buffer.getvalue()
+    return run
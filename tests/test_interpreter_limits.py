@@ -0,0 +1,58 @@
+from interpreter.interpreter import ResourceLimitError
+
+def assert_limit(interpreter, result, limit):
+    assert result.startswith("Resource limit exceeded:")
+    assert isinstance(interpreter.error, ResourceLimitError)
+    assert interpreter.error.limit == limit
+
+def test_no_limits_runs_to_completion(run):
+    interpreter, result, output = run("let x = 10;\nprint(x + 5);")
+    assert result == "Interpretation successful."
+    assert interpreter.error is None
+    assert output == "15.0\n"
+
+def test_step_limit(run):
+    interpreter, result, output = run("let x = 1;\n" + "x = x + 1;\n" * 100, max_steps=50)
+    assert_limit(interpreter, result, "steps")
+    assert interpreter.steps == 51
+
+def test_timeout_is_checked_on_short_scripts(run):
+    interpreter, result, output = run("let x = 1;\nprint(x);", timeout=0)
+    assert_limit(interpreter, result, "timeout")
+    assert output == ""
+
+def test_variable_limit(run):
+    interpreter, result, output = run("let a = 1;\nlet b = 2;\nlet c = 3;", max_variables=2)
+    assert_limit(interpreter, result, "variables")
+    assert list(interpreter.environment) == ["a", "b"]
+
+def test_redeclaring_does_not_count_against_variable_limit(run):
+    interpreter, result, output = run("let a = 1;\nlet a = 2;", max_variables=1)
+    assert result == "Interpretation successful."
+
+def test_output_byte_limit(run):
+    interpreter, result, output = run("print(1);\n" * 10, max_output_bytes=20)
+    assert_limit(interpreter, result, "output bytes")
+    assert len(output.encode("utf-8")) <= 20
+
+def test_int_bits_limit_stops_squaring(run):
+    source = "let x = 3;\n" + "x = x * x;\n" * 30
+    interpreter, result, output = run(source, "int", timeout=0.5, max_steps=1000, max_variables=5, max_int_bits=4096)
+    assert_limit(interpreter, result, "integer bits")
+    assert interpreter.environment["x"].bit_length() <= 4096
+
+def test_fraction_bits_limit(run):
+    source = "let x = 1 / 3;\n" + "x = x * x;\n" * 30
+    interpreter, result, output = run(source, "fraction", max_int_bits=256)
+    assert_limit(interpreter, result, "integer bits")
+
+def test_float_overflow(run):
+    source = "let x = 10;\n" + "x = x * x;\n" * 12 + "print(x);"
+    interpreter, result, output = run(source)
+    assert_limit(interpreter, result, "float range")
+    assert output == ""
+
+def test_runtime_errors_are_not_resource_limits(run):
+    interpreter, result, output = run("let x = 1 / 0;")
+    assert result == "Runtime error: Division by zero."
+    assert not isinstance(interpreter.error, ResourceLimitError)
@@ -0,0 +1,59 @@
+import decimal
+from decimal import Decimal
+
+import pytest
+
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from interpreter.interpreter import ResourceLimitError, decimal_divide
+
+def test_auto_uses_int_when_divisions_are_exact(run):
+    interpreter, result, output = run("let a = (2 + 3) * 4;\nlet b = a / 2;\nprint(b);", "auto")
+    assert interpreter.numeric == "int"
+    assert output == "10\n"
+
+def test_auto_uses_int_without_division(run):
+    interpreter, result, output = run("let x = 9007199254740993;\nprint(x + 0);", "auto")
+    assert interpreter.numeric == "int"
+    assert output == "9007199254740993\n"
+
+def test_auto_uses_float_for_any_inexact_division(run):
+    interpreter, result, output = run("print(7 / 2 * 2);\nprint(6 / 3);", "auto")
+    assert interpreter.numeric == "float"
+    assert output == "7.0\n2.0\n"
+
+def test_auto_uses_float_with_decimal_literals(run):
+    interpreter, result, output = run("print(3 / 2.0);", "auto")
+    assert interpreter.numeric == "float"
+    assert output == "1.5\n"
+
+def test_int_rejects_inexact_division(run):
+    interpreter, result, output = run("print(7 / 2);", "int")
+    assert result == "Runtime error: Inexact division 7 / 2 in int mode."
+
+def test_decimal_is_exact_past_default_precision(run):
+    interpreter, result, output = run("let x = 1000000000000000000000000000000;\nprint(x + 1);", "decimal")
+    assert output == "1000000000000000000000000000001\n"
+
+def test_decimal_rejects_nonterminating_division(run):
+    interpreter, result, output = run("print(1 / 3 * 3);", "decimal")
+    assert result == "Runtime error: Inexact division 1 / 3 in decimal mode."
+
+def test_decimal_digit_limit(run):
+    interpreter, result, output = run("let x = 1" + "0" * 999 + ";\nprint(x * x);", "decimal")
+    assert isinstance(interpreter.error, ResourceLimitError)
+    assert interpreter.error.limit == "decimal digits"
+
+def test_decimal_divide_reports_overflow_as_overflow():
+    context = decimal.Context(Emax=5, traps=[decimal.Overflow, decimal.Inexact, decimal.Rounded])
+    with decimal.localcontext(context):
+        with pytest.raises(decimal.Overflow):
+            decimal_divide(Decimal(100000), Decimal("0.01"))
+
+def test_fraction_is_exact(run):
+    interpreter, result, output = run("print(1 / 3 * 3);", "fraction")
+    assert output == "1\n"
+
+def test_float_literal_out_of_range():
+    ast, errors = Parser(Lexer("let x = 1" + "0" * 400 + ";").tokenize()[0]).parse()
+    assert errors and "out of range in float mode" in errors[0]
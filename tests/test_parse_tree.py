@@ -0,0 +1,77 @@
+from lexer.lexer import Lexer
+from parser.parser import Parser, Program, VarDecl, PrintStmt, BinaryOp, Number, Identifier
+
+README_SOURCE = "let x = 10;\nlet y = x + 5;\nprint(y);"
+
+README_TREE = """\
+Program
+├── VarDecl
+│   ├── LET 'let'
+│   ├── ID 'x'
+│   ├── ASSIGN '='
+│   ├── Number '10.0'
+│   └── SEMI ';'
+├── VarDecl
+│   ├── LET 'let'
+│   ├── ID 'y'
+│   ├── ASSIGN '='
+│   ├── BinaryOp
+│   │   ├── ID 'x'
+│   │   ├── PLUS '+'
+│   │   └── Number '5.0'
+│   └── SEMI ';'
+└── PrintStmt
+    ├── PRINT 'print'
+    ├── LPAREN '('
+    ├── ID 'y'
+    ├── RPAREN ')'
+    └── SEMI ';'"""
+
+def parse(source):
+    parser = Parser(Lexer(source).tokenize()[0])
+    ast, errors = parser.parse()
+    assert not errors
+    return parser, ast
+
+def test_render_tree_matches_readme():
+    parser, ast = parse(README_SOURCE)
+    assert "\n".join(parser.render_tree(ast)) == README_TREE
+
+def test_print_tree(capsys):
+    parser, ast = parse(README_SOURCE)
+    parser.print_tree(ast)
+    assert capsys.readouterr().out == README_TREE + "\n"
+
+def test_render_tree_paging():
+    parser, ast = parse(README_SOURCE)
+    lines = README_TREE.splitlines()
+    assert list(parser.render_tree(ast, limit=3)) == lines[:3]
+    assert list(parser.render_tree(ast, start=9, limit=4)) == lines[9:13]
+    assert list(parser.render_tree(ast, start=20)) == lines[20:]
+    assert list(parser.render_tree(ast, start=len(lines))) == []
+    pages = [list(parser.render_tree(ast, start, 5)) for start in range(0, len(lines), 5)]
+    assert sum(pages, []) == lines
+
+def test_iter_tree_depth_path_and_last():
+    parser, ast = parse("let x = 1 + 2;\nprint(x);")
+    items = list(parser.iter_tree(ast))
+    assert items[0] == (ast, 0, (), True)
+    decl, stmt = ast.statements
+    nodes = [(item, depth, path, is_last) for item, depth, path, is_last in items if not isinstance(item, str)]
+    assert [(type(item), depth, path, is_last) for item, depth, path, is_last in nodes] == [
+        (Program, 0, (), True),
+        (VarDecl, 1, (0,), False),
+        (BinaryOp, 2, (0, 3), False),
+        (Number, 3, (0, 3, 0), False),
+        (Number, 3, (0, 3, 2), True),
+        (PrintStmt, 1, (1,), True),
+        (Identifier, 2, (1, 2), False),
+    ]
+    assert nodes[1][0] is decl and nodes[5][0] is stmt
+    assert items[-1] == ("SEMI ';'", 2, (1, 4), True)
+
+def test_render_tree_is_lazy_on_deep_trees():
+    parser, ast = parse("print(" + " + ".join(["1"] * 3000) + ");")
+    lines = list(parser.render_tree(ast, start=5000, limit=10))
+    assert len(lines) == 10
+    assert lines == list(parser.render_tree(ast, start=4995, limit=15))[5:]
@@ -0,0 +1,97 @@
+from lexer import LineIndex
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from semantic.semantic_analyzer import SemanticAnalyzer
+
+def parse(source):
+    tokens, lex_errors = Lexer(source).tokenize()
+    ast, parse_errors = Parser(tokens).parse()
+    assert not lex_errors and not parse_errors
+    return ast
+
+def text(source, node):
+    return source[node.span[0]:node.span[1]]
+
+def test_position_on_multiple_lines():
+    index = LineIndex("ab\ncde\nf")
+    assert index.line_count() == 3
+    assert index.position(0) == (1, 1)
+    assert index.position(1) == (1, 2)
+    assert index.position(4) == (2, 2)
+    assert index.position(7) == (3, 1)
+
+def test_newline_belongs_to_its_line_and_next_offset_starts_a_new_one():
+    index = LineIndex("ab\ncd")
+    assert index.position(2) == (1, 3)
+    assert index.position(3) == (2, 1)
+
+def test_end_of_file_without_trailing_newline():
+    source = "let x = 1;"
+    assert LineIndex(source).position(len(source)) == (1, 11)
+
+def test_end_of_file_after_trailing_newline():
+    source = "let x = 1;\n"
+    index = LineIndex(source)
+    assert index.line_count() == 2
+    assert index.position(len(source)) == (2, 1)
+
+def test_positions_match_lexer_tokens():
+    source = "let x = 1;\n\n   print( x );\n\tx = 2"
+    index = LineIndex(source)
+    tokens, errors = Lexer(source).tokenize()
+    for token in tokens[:-1]:
+        assert index.position(token.offset) == (token.line, token.column)
+
+def test_node_spans():
+    source = "let x = (1 + 2) * 3;\nprint(-x);"
+    program = parse(source)
+    decl, stmt = program.statements
+    assert text(source, decl) == "let x = (1 + 2) * 3;"
+    assert text(source, decl.expr) == "(1 + 2) * 3"
+    assert text(source, decl.expr.left) == "1 + 2"
+    assert text(source, decl.expr.right) == "3"
+    assert text(source, stmt.expr) == "-x"
+    assert text(source, stmt.expr.expr) == "x"
+
+def test_parentheses_do_not_change_inner_spans():
+    source = "print(( y ));\nlet z = 1 * (2 + 3);"
+    program = parse(source)
+    stmt, decl = program.statements
+    assert text(source, stmt) == "print(( y ));"
+    assert text(source, stmt.expr) == "y"
+    assert text(source, decl.expr) == "1 * (2 + 3)"
+    assert text(source, decl.expr.right) == "2 + 3"
+
+def test_semantic_error_inside_parentheses_points_at_identifier():
+    source = "let x = 1;\nprint(x + (  y));"
+    analyzer = SemanticAnalyzer()
+    errors = analyzer.analyze(parse(source), source)
+    assert errors == ["Variable 'y' not declared at line 2, col 14."]
+
+def test_parse_errors_carry_locations():
+    source = "let x = 1\nprint(x + );\nlet = 3;"
+    parser = Parser(Lexer(source).tokenize()[0])
+    ast, errors = parser.parse()
+    assert errors == [
+        "Expect expression at line 2, col 11.",
+        "Expect variable name at line 3, col 5.",
+    ]
+    index = LineIndex(source)
+    assert [message for message, span in parser.diagnostics] == ["Expect expression.", "Expect variable name."]
+    assert [index.position(span[0]) for message, span in parser.diagnostics] == [(2, 11), (3, 5)]
+
+def test_parse_error_at_end_of_file():
+    source = "let x ="
+    parser = Parser(Lexer(source).tokenize()[0])
+    ast, errors = parser.parse()
+    assert errors == ["Expect expression at line 1, col 8."]
+    assert parser.diagnostics == [("Expect expression.", (7, 7))]
+
+def test_semantic_error_location_over_leading_indentation():
+    source = "\n    let x = 1;\n    print(x + y);"
+    analyzer = SemanticAnalyzer()
+    errors = analyzer.analyze(parse(source), source)
+    assert errors == ["Variable 'y' not declared at line 3, col 15."]
+    message, span = analyzer.diagnostics[0]
+    assert message == "Variable 'y' not declared."
+    assert analyzer.line_index.span_positions(span) == ((3, 15), (3, 16))